@@ -1,10 +1,15 @@
 import arcade
+import pyglet
+from PIL import Image, ImageDraw
 import random
-from typing import List, Tuple, Optional, Dict
-from enum import Enum
+from typing import List, Tuple, Optional, Dict, AbstractSet
+from enum import Enum, IntEnum
 import math
 import time
-import copy
+import pickle
+from collections import Counter
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # SMALLER SCREEN SIZE FOR LAPTOPS
 SCREEN_WIDTH = 1000
@@ -12,10 +17,17 @@ SCREEN_HEIGHT = 700
 SCREEN_TITLE = "Q Game - Dark Edition"
 
 TILE_SIZE = 35  # Smaller tiles
+
+# Flat board grid: the 108 tiles in the bag can never reach further than this from the center
+BOARD_RADIUS = 110
+BOARD_STRIDE = 2 * BOARD_RADIUS + 1
 BOARD_OFFSET_X = 500
 BOARD_OFFSET_Y = 350
 HAND_Y = 80
 
+# Buttons down the left side: (label, center x, center y); PLACE and CLEAR need pending placements
+BUTTON_LAYOUT = (("PLACE", 100, 400), ("CLEAR", 100, 340), ("PASS", 100, 280))
+
 # Dark Elegant Color Scheme
 BG_COLOR = (25, 25, 35)  # Dark blue-gray
 PANEL_COLOR = (40, 40, 55)  # Dark panel
@@ -33,52 +45,186 @@ HAND_PANEL_COLOR = (35, 35, 50)
 GRID_COLOR = (50, 50, 70)
 GRID_HIGHLIGHT = (65, 65, 85)
 
-class Shape(Enum):
-    CIRCLE = "circle"
-    SQUARE = "square"
-    STAR = "star"
-    DIAMOND = "diamond"
-    CLOVER = "clover"
-    CROSS = "cross"
-
-class Color(Enum):
-    RED = (255, 100, 100)  # Bright red
-    BLUE = (100, 180, 255)  # Bright blue
-    GREEN = (100, 220, 100)  # Bright green
-    YELLOW = (255, 220, 100)  # Gold
-    PURPLE = (180, 120, 220)  # Purple
-    ORANGE = (255, 160, 80)  # Orange
+class Shape(IntEnum):
+    CIRCLE = 0
+    SQUARE = 1
+    STAR = 2
+    DIAMOND = 3
+    CLOVER = 4
+    CROSS = 5
+
+class Color(IntEnum):
+    RED = 0
+    BLUE = 1
+    GREEN = 2
+    YELLOW = 3
+    PURPLE = 4
+    ORANGE = 5
+
+# RGB of each tile color, indexed by Color
+COLOR_RGB = (
+    (255, 100, 100),  # Bright red
+    (100, 180, 255),  # Bright blue
+    (100, 220, 100),  # Bright green
+    (255, 220, 100),  # Gold
+    (180, 120, 220),  # Purple
+    (255, 160, 80),  # Orange
+)
+
+# Row/column steps to the four orthogonal neighbours of a board position
+NEIGHBOR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+INVALID_LINE_MSG = "Must be all same color with unique shapes OR all same shape with unique colors"
 
 class GameState(Enum):
     PLAYER_TURN = 0
     AI_TURN = 1
     GAME_OVER = 2
 
+# Where the shape bits start in a tile's line code (the color bits sit below them)
+SHAPE_BITS_SHIFT = 8
+COLOR_BITS = (1 << SHAPE_BITS_SHIFT) - 1
+
+# Unit-size outlines of the tile shapes, scaled to the shape size when rendered
+STAR_POINTS = tuple(
+    ((1.0 if i % 2 == 0 else 0.5) * math.cos(math.pi / 2 + i * 2 * math.pi / 10),
+     (1.0 if i % 2 == 0 else 0.5) * math.sin(math.pi / 2 + i * 2 * math.pi / 10))
+    for i in range(10)
+)
+DIAMOND_POINTS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+CLOVER_OFFSETS = ((0, 1), (-1, 0), (1, 0), (0, -1))
+
+# Shape painters for tile textures: (draw, center, size, fill, outline, width), y grows downwards
+def _paint_circle(draw, center, size, fill, outline, width):
+    r = size / 2
+    draw.ellipse((center - r, center - r, center + r, center + r), fill=fill, outline=outline, width=width)
+
+def _paint_square(draw, center, size, fill, outline, width):
+    h = size / 2
+    draw.rectangle((center - h, center - h, center + h, center + h), fill=fill, outline=outline, width=width)
+
+def _paint_star(draw, center, size, fill, outline, width):
+    r = size / 2
+    points = [(center + px * r, center - py * r) for px, py in STAR_POINTS]
+    draw.polygon(points, fill=fill, outline=outline, width=width)
+
+def _paint_diamond(draw, center, size, fill, outline, width):
+    r = size / 2
+    points = [(center + px * r, center - py * r) for px, py in DIAMOND_POINTS]
+    draw.polygon(points, fill=fill, outline=outline, width=width)
+
+def _paint_clover(draw, center, size, fill, outline, width):
+    r = size / 3
+    for px, py in CLOVER_OFFSETS:
+        cx, cy = center + px * r, center - py * r
+        draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=fill)
+
+def _paint_cross(draw, center, size, fill, outline, width):
+    long_half, short_half = size * 0.35, size * 0.1
+    draw.rectangle((center - long_half, center - short_half, center + long_half, center + short_half), fill=fill)
+    draw.rectangle((center - short_half, center - long_half, center + short_half, center + long_half), fill=fill)
+
+# Indexed by Shape
+SHAPE_PAINTERS = (_paint_circle, _paint_square, _paint_star, _paint_diamond, _paint_clover, _paint_cross)
+
 # ============================================================================
-# TILE CLASS (UNCHANGED)
+# TILE CLASS
 # ============================================================================
 class Tile:
+    __slots__ = ("shape", "color", "_id", "_color_bit", "_shape_bit", "_line_bits")
+    
     def __init__(self, shape: Shape, color: Color):
         self.shape = shape
         self.color = color
+        self._id = (shape << 3) | color  # Packs the tile into 6 bits
+        self._color_bit = 1 << color
+        self._shape_bit = 1 << shape
+        # Both bits in one code, so OR-ing a line's codes gives its color and shape masks at once
+        self._line_bits = self._color_bit | (self._shape_bit << SHAPE_BITS_SHIFT)
     
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Tile):
             return False
-        return self.shape == other.shape and self.color == other.color
+        return self._id == other._id
     
     def __hash__(self):
-        return hash((self.shape, self.color))
+        return self._id
     
     def __repr__(self):
         return f"Tile({self.shape.name}, {self.color.name})"
+    
+    # Tiles are shared immutable instances, so copies of the game keep using them
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return _interned_tile, (self.shape, self.color)
+
+# One shared instance per (shape, color); the bag and hands hold references to these
+_TILES = {(shape, color): Tile(shape, color) for shape in Shape for color in Color}
+
+def _interned_tile(shape: Shape, color: Color) -> Tile:
+    """The shared instance of a tile (used when unpickling)"""
+    return _TILES[(shape, color)]
+
+# Zobrist hashing of the board: one random 64-bit key per (cell index, tile id), made on first use
+_ZOBRIST_RNG = random.Random(0x5147)
+_ZOBRIST_KEYS: Dict[int, int] = {}
+
+def _zobrist_key(index: int, tile_id: int) -> int:
+    slot = (index << 6) | tile_id
+    key = _ZOBRIST_KEYS.get(slot)
+    if key is None:
+        key = _ZOBRIST_KEYS[slot] = _ZOBRIST_RNG.getrandbits(64)
+    return key
+
+# Transposition table entries store a minimax value plus which kind of bound it is
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+TT_MAX_ENTRIES = 200_000
+
+# Most a single tile move can change the evaluation besides its own score (hand size and
+# frontier terms move by under 1), with room to spare; used for futility pruning
+FUTILITY_MARGIN = 2
+
+# AI search limits: plies searched below each candidate move, and the seconds after which no
+# deeper iterative deepening pass is started (an unfinished pass is discarded)
+AI_SEARCH_DEPTH = 3
+AI_TIME_BUDGET = 1.5
+
+class UndoRecord:
+    """What _apply_move changed, so _undo_move can put it back"""
+    __slots__ = ("placements", "removed", "drawn", "score", "old_passes", "old_player", "old_state",
+                 "frontier_added", "frontier_removed")
+    
+    def __init__(self, placements, removed, drawn, score, old_passes, old_player, old_state):
+        self.placements = placements  # The (row, col, tile) placements that were played
+        self.removed = removed  # (hand index, tile) for each tile taken from the hand, in removal order
+        self.drawn = drawn  # Number of tiles drawn from the bag onto the end of the hand
+        self.score = score
+        self.old_passes = old_passes
+        self.old_player = old_player
+        self.old_state = old_state
+        self.frontier_added = []  # Positions _update_valid_positions added to the valid positions
+        self.frontier_removed = []  # Valid positions that got covered by the move
 
 # ============================================================================
-# GAME ENGINE WITH MINIMAX AI (UNCHANGED)
+# GAME ENGINE WITH MINIMAX AI
 # ============================================================================
 class QGameEngine:
     def __init__(self):
         self.board = {}  # Dict of (row, col) -> Tile
+        # Flat mirror of the board for line walks: (row + R) * STRIDE + (col + R) -> tile line code, 0 if empty
+        self._cells = [0] * (BOARD_STRIDE * BOARD_STRIDE)
+        self._hash = 0  # Zobrist hash of the board, updated by _place_tile/_remove_tile
+        self._tt = {}  # Minimax transposition table: search key -> (bound, value)
+        self._killers = {}  # Search depth -> last move that caused an alpha-beta cutoff there
         self.players = [
             {"name": "Player", "hand": [], "score": 0, "is_ai": False},
             {"name": "AI", "hand": [], "score": 0, "is_ai": True}
@@ -86,77 +232,137 @@ class QGameEngine:
         self.current_player = 0
         self.game_state = GameState.PLAYER_TURN
         self.tile_bag = self.create_tile_bag()
+        # Tiles are drawn from the end of the shuffled bag; everything before this index is still in it
+        self._bag_idx = len(self.tile_bag)
         self.consecutive_passes = 0
         self.debug_info = ""
+        # Empty cells adjacent to the board, kept up to date by make_move
+        self._valid_positions = {(0, 0)}
         
         # Deal initial hands
         for player in self.players:
             player["hand"] = [self.draw_tile() for _ in range(6)]
+            player["hand_counter"] = Counter(player["hand"])
         
         # Place first tile in center
-        if self.tile_bag:
-            first_tile = self.tile_bag.pop()
-            self.board[(0, 0)] = first_tile
+        first_tile = self.draw_tile()
+        if first_tile:
+            self._place_tile(0, 0, first_tile)
+            self._update_valid_positions([(0, 0)])
 
     def create_tile_bag(self) -> List[Tile]:
         """Create 3 copies of each tile combination"""
-        bag = []
-        for shape in Shape:
-            for color in Color:
-                for _ in range(3):
-                    bag.append(Tile(shape, color))
+        bag = [tile for tile in _TILES.values() for _ in range(3)]
         random.shuffle(bag)
         return bag
 
     def draw_tile(self) -> Optional[Tile]:
         """Draw one tile from the bag"""
-        if not self.tile_bag:
+        if self._bag_idx == 0:
             return None
-        return self.tile_bag.pop()
+        self._bag_idx -= 1
+        return self.tile_bag[self._bag_idx]
+
+    def tiles_remaining(self) -> int:
+        """Number of tiles left in the bag"""
+        return self._bag_idx
+
+    @staticmethod
+    def _cell_index(row: int, col: int) -> int:
+        """Index of a board position in the flat cell list"""
+        return (row + BOARD_RADIUS) * BOARD_STRIDE + col + BOARD_RADIUS
+
+    @staticmethod
+    def _on_board(placements: List[Tuple[int, int, Tile]]) -> bool:
+        """Whether all placements lie inside the empty border the line walks stop at"""
+        return all(-BOARD_RADIUS < row < BOARD_RADIUS and -BOARD_RADIUS < col < BOARD_RADIUS
+                   for row, col, _ in placements)
+
+    def _place_tile(self, row: int, col: int, tile: Tile):
+        """Put a tile on the board, keeping the flat cell list in sync"""
+        index = self._cell_index(row, col)
+        self.board[(row, col)] = tile
+        self._cells[index] = tile._line_bits
+        self._hash ^= _zobrist_key(index, tile._id)
+
+    def _remove_tile(self, row: int, col: int):
+        """Take a tile off the board, keeping the flat cell list in sync"""
+        index = self._cell_index(row, col)
+        tile = self.board.pop((row, col))
+        self._cells[index] = 0
+        self._hash ^= _zobrist_key(index, tile._id)
 
     def get_current_player(self):
         return self.players[self.current_player]
 
-    def get_valid_positions(self) -> List[Tuple[int, int]]:
-        """Get all empty positions adjacent to existing tiles"""
-        if not self.board:
-            return [(0, 0)]
-        
-        positions = set()
-        for (row, col) in self.board.keys():
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+    @property
+    def valid_positions(self) -> AbstractSet[Tuple[int, int]]:
+        """Empty positions adjacent to existing tiles (the engine's own set, not to be modified)"""
+        return self._valid_positions
+
+    @property
+    def board_hash(self) -> int:
+        """Zobrist hash of the tiles on the board; changes whenever a tile is placed or removed"""
+        return self._hash
+
+    def _update_valid_positions(self, placed: List[Tuple[int, int]], added: Optional[list] = None,
+                                removed: Optional[list] = None):
+        """Incrementally update the cached valid positions after tiles are placed.
+        
+        If given, ``added`` and ``removed`` collect the positions that entered and left the set.
+        """
+        board = self.board
+        valid_positions = self._valid_positions
+        for pos in placed:
+            if pos in valid_positions:
+                valid_positions.remove(pos)
+                if removed is not None:
+                    removed.append(pos)
+            row, col = pos
+            for dr, dc in NEIGHBOR_OFFSETS:
                 new_pos = (row + dr, col + dc)
-                if new_pos not in self.board:
-                    positions.add(new_pos)
-        
-        return list(positions)
+                if new_pos not in board and new_pos not in valid_positions:
+                    valid_positions.add(new_pos)
+                    if added is not None:
+                        added.append(new_pos)
 
     def is_valid_placement(self, placements: List[Tuple[int, int, Tile]]) -> Tuple[bool, str]:
         """Check if placement is valid according to Q game rules"""
+        valid, msg, _ = self._validate_and_score(placements)
+        return valid, msg
+
+    def _validate_and_score(self, placements: List[Tuple[int, int, Tile]]) -> Tuple[bool, str, int]:
+        """Validate a placement and score it from the same line walks"""
         if not placements:
-            return False, "No placements"
+            return False, "No placements", 0
         
-        player = self.get_current_player()
+        board = self.board
+        cells = self._cells
+        cell_index = self._cell_index
         
         # Check player has all the tiles
-        hand_copy = player["hand"].copy()
-        try:
-            for _, _, tile in placements:
-                hand_copy.remove(tile)
-        except ValueError:
-            return False, "Don't have these tiles"
-        
-        # Check positions are empty
-        for row, col, _ in placements:
-            if (row, col) in self.board:
-                return False, "Position occupied"
+        hand_counter = self.players[self.current_player]["hand_counter"]
+        needed = Counter(tile for _, _, tile in placements)
+        for tile, count in needed.items():
+            if hand_counter[tile] < count:
+                return False, "Don't have these tiles", 0
+        
+        # No tile can ever reach a position outside the flat cell grid
+        if not self._on_board(placements):
+            return False, "Must connect to existing tiles", 0
+        
+        # Check positions are empty, using flat cell indices rather than tuple keys
+        indices = [cell_index(row, col) for row, col, _ in placements]
+        for index in indices:
+            if cells[index]:
+                return False, "Position occupied", 0
         
         # Check all placements are in same row OR same column
         rows = {pos[0] for pos in placements}
         cols = {pos[1] for pos in placements}
         
         if len(rows) > 1 and len(cols) > 1:
-            return False, "Must be in same row or column"
+            return False, "Must be in same row or column", 0
         
         # Check contiguous placement
         if len(placements) > 1:
@@ -164,158 +370,131 @@ class QGameEngine:
                 sorted_cols = sorted([pos[1] for pos in placements])
                 for i in range(len(sorted_cols) - 1):
                     if sorted_cols[i + 1] - sorted_cols[i] != 1:
-                        return False, "Tiles must be adjacent horizontally"
+                        return False, "Tiles must be adjacent horizontally", 0
             else:  # Vertical line
                 sorted_rows = sorted([pos[0] for pos in placements])
                 for i in range(len(sorted_rows) - 1):
                     if sorted_rows[i + 1] - sorted_rows[i] != 1:
-                        return False, "Tiles must be adjacent vertically"
+                        return False, "Tiles must be adjacent vertically", 0
         
         # Check connection to existing board
-        if len(self.board) > 0:
-            connected = False
-            for row, col, _ in placements:
-                for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    if (row + dr, col + dc) in self.board:
-                        connected = True
-                        break
-                if connected:
+        if board:
+            for index in indices:
+                if (cells[index - BOARD_STRIDE] or cells[index + BOARD_STRIDE]
+                        or cells[index - 1] or cells[index + 1]):
                     break
-            if not connected:
-                return False, "Must connect to existing tiles"
-        
-        # Validate all affected lines after placement
-        temp_board = self.board.copy()
-        for row, col, tile in placements:
-            temp_board[(row, col)] = tile
-        
-        # Check each row and column that contains new placements
-        for row, col, _ in placements:
-            # Check the entire row containing this placement
-            row_tiles = []
-            c = col
-            while (row, c) in temp_board:
-                c -= 1
-            c += 1
-            while (row, c) in temp_board:
-                row_tiles.append(temp_board[(row, c)])
-                c += 1
-            
-            if len(row_tiles) > 1:
-                valid, msg = self.validate_line(row_tiles)
-                if not valid:
-                    return False, f"Row invalid: {msg}"
-            
-            # Check the entire column containing this placement
-            col_tiles = []
-            r = row
-            while (r, col) in temp_board:
-                r -= 1
-            r += 1
-            while (r, col) in temp_board:
-                col_tiles.append(temp_board[(r, col)])
-                r += 1
+            else:
+                return False, "Must connect to existing tiles", 0
+        
+        # Validate and score all affected lines with the placements applied in place.
+        # The placements all lie on one shared line, which is walked only for the
+        # first placement; every other line crosses it at a different placement.
+        shared_step = 1 if len(rows) == 1 else BOARD_STRIDE
+        line_stats = self._line_stats
+        line_is_valid = self._line_is_valid
+        score = 0
+        try:
+            place_tile = self._place_tile
+            for row, col, tile in placements:
+                place_tile(row, col, tile)
             
-            if len(col_tiles) > 1:
-                valid, msg = self.validate_line(col_tiles)
-                if not valid:
-                    return False, f"Column invalid: {msg}"
+            # Check each row and column that contains new placements
+            for i, index in enumerate(indices):
+                for axis, step in (("Row", 1), ("Column", BOARD_STRIDE)):
+                    if step == shared_step and i > 0:
+                        continue
+                    _, length, color_mask, shape_mask = line_stats(index, step)
+                    if length < 2:
+                        continue
+                    if not line_is_valid(length, color_mask, shape_mask):
+                        return False, f"{axis} invalid: {INVALID_LINE_MSG}", 0
+                    score += length
+        finally:
+            # Take the trial placements back off the board
+            remove_tile = self._remove_tile
+            for row, col, _ in placements:
+                remove_tile(row, col)
         
-        return True, "Valid"
+        # Single tile gets 1 point if no lines scored
+        return True, "Valid", score or 1
 
-    def validate_line(self, tiles: List[Tile]) -> Tuple[bool, str]:
-        """Validate a line according to Q game rules"""
-        if len(tiles) < 2:
-            return True, ""
-        
-        colors = [tile.color for tile in tiles]
-        shapes = [tile.shape for tile in tiles]
+    def _line_stats(self, index: int, step: int) -> Tuple[int, int, int, int]:
+        """Start index, length, color mask and shape mask of the line through a cell
+        (an empty cell counts towards the length but adds nothing to the masks)"""
+        cells = self._cells
+        mask = cells[index]
+        length = 1
+        
+        # Walk outwards both ways from the cell so no tile is visited twice
+        i = index - step
+        while cells[i]:
+            mask |= cells[i]
+            length += 1
+            i -= step
+        start = i + step
+        i = index + step
+        while cells[i]:
+            mask |= cells[i]
+            length += 1
+            i += step
+        return start, length, mask & COLOR_BITS, mask >> SHAPE_BITS_SHIFT
+
+    @staticmethod
+    def _line_is_valid(length: int, color_mask: int, shape_mask: int) -> bool:
+        """Check a line from its color/shape masks"""
+        if length < 2:
+            return True
         
         # Option 1: All same color, all different shapes
-        if len(set(colors)) == 1 and len(set(shapes)) == len(shapes):
-            return True, ""
+        if color_mask & (color_mask - 1) == 0 and shape_mask.bit_count() == length:
+            return True
         
         # Option 2: All same shape, all different colors
-        if len(set(shapes)) == 1 and len(set(colors)) == len(colors):
-            return True, ""
+        if shape_mask & (shape_mask - 1) == 0 and color_mask.bit_count() == length:
+            return True
         
-        return False, "Must be all same color with unique shapes OR all same shape with unique colors"
-
-    def calculate_score(self, placements: List[Tuple[int, int, Tile]]) -> int:
-        """Calculate score for this placement"""
-        temp_board = self.board.copy()
-        for row, col, tile in placements:
-            temp_board[(row, col)] = tile
-        
-        score = 0
-        scored_lines = set()
-        
-        for row, col, _ in placements:
-            # Score row
-            row_tiles = []
-            c = col
-            while (row, c) in temp_board:
-                c -= 1
-            c += 1
-            start_col = c
-            while (row, c) in temp_board:
-                row_tiles.append(temp_board[(row, c)])
-                c += 1
-            
-            if len(row_tiles) > 1:
-                line_key = ('row', row, start_col)
-                if line_key not in scored_lines:
-                    score += len(row_tiles)
-                    scored_lines.add(line_key)
-            
-            # Score column
-            col_tiles = []
-            r = row
-            while (r, col) in temp_board:
-                r -= 1
-            r += 1
-            start_row = r
-            while (r, col) in temp_board:
-                col_tiles.append(temp_board[(r, col)])
-                r += 1
-            
-            if len(col_tiles) > 1:
-                line_key = ('col', col, start_row)
-                if line_key not in scored_lines:
-                    score += len(col_tiles)
-                    scored_lines.add(line_key)
-        
-        # Single tile gets 1 point if no lines scored
-        if score == 0 and placements:
-            score = 1
-        
-        return score
+        return False
 
     def make_move(self, placements: List[Tuple[int, int, Tile]]) -> Tuple[bool, int, str]:
         """Execute a move"""
-        valid, msg = self.is_valid_placement(placements)
+        valid, msg, score = self._validate_and_score(placements)
         if not valid:
             return False, 0, msg
         
-        player = self.get_current_player()
+        self._apply_move(placements, score)
+        return True, score, "Success"
+
+    def _apply_move(self, placements: List[Tuple[int, int, Tile]], score: int) -> UndoRecord:
+        """Play an already validated move and return the record needed to undo it"""
+        player = self.players[self.current_player]
+        hand = player["hand"]
+        hand_counter = player["hand_counter"]
+        record = UndoRecord(placements, [], 0, score, self.consecutive_passes, self.current_player,
+                            self.game_state)
         
         # Remove tiles from hand
         for _, _, tile in placements:
-            player["hand"].remove(tile)
+            index = hand.index(tile)
+            del hand[index]
+            hand_counter[tile] -= 1
+            record.removed.append((index, tile))
         
         # Place tiles on board
         for row, col, tile in placements:
-            self.board[(row, col)] = tile
+            self._place_tile(row, col, tile)
+        self._update_valid_positions([(row, col) for row, col, _ in placements],
+                                     record.frontier_added, record.frontier_removed)
         
-        # Calculate score
-        score = self.calculate_score(placements)
+        # Score was computed during validation
         player["score"] += score
         
         # Draw new tiles
         for _ in range(len(placements)):
             new_tile = self.draw_tile()
             if new_tile:
-                player["hand"].append(new_tile)
+                hand.append(new_tile)
+                hand_counter[new_tile] += 1
+                record.drawn += 1
         
         # Reset consecutive passes
         self.consecutive_passes = 0
@@ -324,7 +503,34 @@ class QGameEngine:
         self.current_player = 1 - self.current_player
         self.game_state = GameState.AI_TURN if self.players[self.current_player]["is_ai"] else GameState.PLAYER_TURN
         
-        return True, score, "Success"
+        return record
+
+    def _undo_move(self, record: UndoRecord):
+        """Take back a move played by _apply_move"""
+        player = self.players[record.old_player]
+        hand = player["hand"]
+        hand_counter = player["hand_counter"]
+        
+        # Return the drawn tiles to the bag
+        for _ in range(record.drawn):
+            hand_counter[hand.pop()] -= 1
+        self._bag_idx += record.drawn
+        
+        # Put the played tiles back where they were in the hand
+        for index, tile in reversed(record.removed):
+            hand.insert(index, tile)
+            hand_counter[tile] += 1
+        
+        for row, col, _ in record.placements:
+            self._remove_tile(row, col)
+        valid_positions = self._valid_positions
+        valid_positions.difference_update(record.frontier_added)
+        valid_positions.update(record.frontier_removed)
+        
+        player["score"] -= record.score
+        self.consecutive_passes = record.old_passes
+        self.current_player = record.old_player
+        self.game_state = record.old_state
 
     def pass_turn(self):
         """Pass the current player's turn"""
@@ -337,7 +543,7 @@ class QGameEngine:
             self.game_state = GameState.GAME_OVER
 
     # ============================================================================
-    # MINIMAX AI IMPLEMENTATION (UNCHANGED)
+    # MINIMAX AI IMPLEMENTATION
     # ============================================================================
     def evaluate_game_state(self) -> float:
         """Evaluate the current game state from AI's perspective"""
@@ -356,36 +562,123 @@ class QGameEngine:
         tile_advantage = (ai_tile_count - player_tile_count) * 0.5
         
         # Advantage for board control (more placement options)
-        valid_positions = self.get_valid_positions()
-        placement_advantage = len(valid_positions) * 0.1
+        placement_advantage = len(self._valid_positions) * 0.1
         
         return score_diff + tile_advantage + placement_advantage + ai_advantage
 
+    def _line_masks(self, row: int, col: int, dr: int, dc: int) -> Tuple[int, int, int]:
+        """Color mask, shape mask and length of the tiles on both sides of empty (row, col) along one axis"""
+        _, length, color_mask, shape_mask = self._line_stats(self._cell_index(row, col), dr * BOARD_STRIDE + dc)
+        return color_mask, shape_mask, length - 1
+
+    @staticmethod
+    def _tile_fits_line(color_bit: int, shape_bit: int, line: Tuple[int, int, int]) -> bool:
+        """Check if a tile can join an existing (already valid) line"""
+        color_mask, shape_mask, count = line
+        if count == 0:
+            return True
+        
+        # Same color as the line and a shape it doesn't have yet
+        if color_mask == color_bit and not shape_mask & shape_bit and shape_mask.bit_count() == count:
+            return True
+        
+        # Same shape as the line and a color it doesn't have yet
+        if shape_mask == shape_bit and not color_mask & color_bit and color_mask.bit_count() == count:
+            return True
+        
+        return False
+
     def get_all_possible_moves(self) -> List[List[Tuple[int, int, Tile]]]:
         """Get all possible moves for current player"""
-        player = self.get_current_player()
-        valid_positions = self.get_valid_positions()
+        hand = self.players[self.current_player]["hand"]
+        line_masks = self._line_masks
+        tile_fits_line = self._tile_fits_line
         possible_moves = []
-        
-        # Consider single tile placements (most common)
-        for tile in player["hand"]:
-            for pos in valid_positions:
-                move = [(pos[0], pos[1], tile)]
-                if self.is_valid_placement(move)[0]:
-                    possible_moves.append(move)
+        append = possible_moves.append
+        
+        # The lines through each empty position don't depend on the tile, so walk them once.
+        # They also give the score of a single tile played there. Positions are visited in sorted
+        # order so the moves depend only on the position, not on the set's insertion history.
+        position_lines = []
+        for row, col in sorted(self._valid_positions):
+            row_line = line_masks(row, col, 0, 1)
+            col_line = line_masks(row, col, 1, 0)
+            row_count = row_line[2]
+            col_count = col_line[2]
+            score = ((row_count + 1 if row_count else 0) + (col_count + 1 if col_count else 0)) or 1
+            position_lines.append((row, col, row_line, col_line, score))
+        
+        # Consider single tile placements (most common); copies of the same tile give the same moves
+        for tile in dict.fromkeys(hand):
+            color_bit = tile._color_bit
+            shape_bit = tile._shape_bit
+            for row, col, row_line, col_line, score in position_lines:
+                if (tile_fits_line(color_bit, shape_bit, row_line)
+                        and tile_fits_line(color_bit, shape_bit, col_line)):
+                    append((score, [(row, col, tile)]))
+        
+        # Highest scoring moves first so alpha-beta cuts off early; the sort is stable for ties
+        possible_moves.sort(key=itemgetter(0), reverse=True)
         
         # Limit to reasonable number of moves for performance
-        return possible_moves[:20]  # Consider first 20 valid moves
+        return [move for _, move in possible_moves[:40]]  # Consider the 40 best scoring moves
+
+    def _ordered_moves(self, depth: int, first_move: Optional[List[Tuple[int, int, Tile]]] = None
+                       ) -> List[List[Tuple[int, int, Tile]]]:
+        """Possible moves, with first_move and then the last move that caused a cutoff at this depth up front"""
+        possible_moves = self.get_all_possible_moves()
+        for move in (self._killers.get(depth), first_move):
+            if move is not None and move in possible_moves:
+                possible_moves.remove(move)
+                possible_moves.insert(0, move)
+        return possible_moves
+
+    def _search_key(self, is_maximizing: bool) -> tuple:
+        """Transposition table key covering everything about a position a minimax value depends on"""
+        return (
+            self._hash, is_maximizing, self.current_player, self.consecutive_passes, self._bag_idx,
+            self.players[1]["score"] - self.players[0]["score"],
+            tuple(tile._id for tile in self.players[0]["hand"]),
+            tuple(tile._id for tile in self.players[1]["hand"]),
+        )
 
     def minimax(self, depth: int, alpha: float, beta: float, is_maximizing: bool) -> float:
-        """MiniMax algorithm with alpha-beta pruning"""
+        """MiniMax algorithm with alpha-beta pruning and a transposition table"""
         # Terminal conditions
         if depth == 0 or self.game_state == GameState.GAME_OVER:
             return self.evaluate_game_state()
         
+        # Reuse the result of an earlier search of the same position to the same depth if it settles
+        # this window; a search to any depth still tells which move to try first
+        key = self._search_key(is_maximizing)
+        entry = self._tt.get(key)
+        first_move = None
+        if entry is not None:
+            entry_depth, bound, value, first_move = entry
+            if entry_depth == depth and (bound == TT_EXACT or (bound == TT_LOWER and value >= beta)
+                                         or (bound == TT_UPPER and value <= alpha)):
+                return value
+        
+        value, best_move = self._minimax_search(depth, alpha, beta, is_maximizing, first_move)
+        
+        if value <= alpha:
+            bound = TT_UPPER
+        elif value >= beta:
+            bound = TT_LOWER
+        else:
+            bound = TT_EXACT
+        if len(self._tt) >= TT_MAX_ENTRIES:
+            del self._tt[next(iter(self._tt))]  # Evict the oldest entry
+        self._tt[key] = (depth, bound, value, best_move)
+        return value
+
+    def _minimax_search(self, depth: int, alpha: float, beta: float, is_maximizing: bool,
+                        first_move: Optional[List[Tuple[int, int, Tile]]]) -> Tuple[float, Optional[list]]:
+        """Search the moves of one minimax node, returning its value and best move"""
+        best_move = None
         if is_maximizing:
             max_eval = -float('inf')
-            possible_moves = self.get_all_possible_moves()
+            possible_moves = self._ordered_moves(depth, first_move)
             
             if not possible_moves:  # No moves available, must pass
                 # Simulate pass
@@ -400,34 +693,35 @@ class QGameEngine:
                 
                 max_eval = max(max_eval, eval)
             else:
+                static_eval = self.evaluate_game_state() if depth == 1 else 0
                 for move in possible_moves:
-                    # Save current state
-                    old_board = self.board.copy()
-                    old_hands = [player["hand"].copy() for player in self.players]
-                    old_scores = [player["score"] for player in self.players]
-                    old_player = self.current_player
+                    valid, _, score = self._validate_and_score(move)
+                    if not valid:
+                        continue
                     
-                    # Make move
-                    self.make_move(move)
-                    eval = self.minimax(depth - 1, alpha, beta, False)
+                    # Futility pruning: one ply above the leaves a move can't beat alpha if even
+                    # its score plus the most the rest of the evaluation can move stays below it
+                    if depth == 1 and static_eval + score + FUTILITY_MARGIN < alpha:
+                        max_eval = max(max_eval, static_eval + score + FUTILITY_MARGIN)
+                        continue
                     
-                    # Undo move
-                    self.board = old_board
-                    for i, player in enumerate(self.players):
-                        player["hand"] = old_hands[i]
-                        player["score"] = old_scores[i]
-                    self.current_player = old_player
-                    self.game_state = GameState.AI_TURN if self.players[self.current_player]["is_ai"] else GameState.PLAYER_TURN
+                    # Make move, search, then take it back
+                    record = self._apply_move(move, score)
+                    eval = self.minimax(depth - 1, alpha, beta, False)
+                    self._undo_move(record)
                     
-                    max_eval = max(max_eval, eval)
+                    if eval > max_eval:
+                        max_eval = eval
+                        best_move = move
                     alpha = max(alpha, eval)
                     if beta <= alpha:
+                        self._killers[depth] = move
                         break
             
-            return max_eval
+            return max_eval, best_move
         else:
             min_eval = float('inf')
-            possible_moves = self.get_all_possible_moves()
+            possible_moves = self._ordered_moves(depth, first_move)
             
             if not possible_moves:  # No moves available, must pass
                 # Simulate pass
@@ -442,84 +736,122 @@ class QGameEngine:
                 
                 min_eval = min(min_eval, eval)
             else:
+                static_eval = self.evaluate_game_state() if depth == 1 else 0
                 for move in possible_moves:
-                    # Save current state
-                    old_board = self.board.copy()
-                    old_hands = [player["hand"].copy() for player in self.players]
-                    old_scores = [player["score"] for player in self.players]
-                    old_player = self.current_player
+                    valid, _, score = self._validate_and_score(move)
+                    if not valid:
+                        continue
                     
-                    # Make move
-                    self.make_move(move)
-                    eval = self.minimax(depth - 1, alpha, beta, True)
+                    # Futility pruning, mirrored for the player's moves
+                    if depth == 1 and static_eval - score - FUTILITY_MARGIN > beta:
+                        min_eval = min(min_eval, static_eval - score - FUTILITY_MARGIN)
+                        continue
                     
-                    # Undo move
-                    self.board = old_board
-                    for i, player in enumerate(self.players):
-                        player["hand"] = old_hands[i]
-                        player["score"] = old_scores[i]
-                    self.current_player = old_player
-                    self.game_state = GameState.AI_TURN if self.players[self.current_player]["is_ai"] else GameState.PLAYER_TURN
+                    # Make move, search, then take it back
+                    record = self._apply_move(move, score)
+                    eval = self.minimax(depth - 1, alpha, beta, True)
+                    self._undo_move(record)
                     
-                    min_eval = min(min_eval, eval)
+                    if eval < min_eval:
+                        min_eval = eval
+                        best_move = move
                     beta = min(beta, eval)
                     if beta <= alpha:
+                        self._killers[depth] = move
                         break
             
-            return min_eval
+            return min_eval, best_move
 
-    def ai_make_move(self) -> Tuple[bool, int, str]:
-        """AI makes a move using MiniMax algorithm"""
-        player = self.players[1]  # AI player
-        
+    def __getstate__(self):
+        # Search caches stay behind when the game is copied
+        state = self.__dict__.copy()
+        del state["_tt"], state["_killers"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._tt = {}
+        self._killers = {}
+
+    def snapshot(self) -> "QGameEngine":
+        """Independent copy of the game to search on another thread, with its own search caches"""
+        # A pickle round trip copies the flat cell list in one go, far faster than deepcopy
+        return pickle.loads(pickle.dumps(self, pickle.HIGHEST_PROTOCOL))
+
+    def find_ai_move(self) -> Optional[List[Tuple[int, int, Tile]]]:
+        """Pick the AI's move using MiniMax without playing it (None if it has to pass)"""
         # Get all possible moves
         possible_moves = self.get_all_possible_moves()
         
         if not possible_moves:
-            self.pass_turn()
-            return False, 0, "AI passed (no valid moves)"
+            return None
         
+        # Iterative deepening: each pass searches one ply deeper, starting from the previous pass's
+        # best move, and the transposition table carries move ordering from one pass to the next
+        self._tt.clear()
+        deadline = time.monotonic() + AI_TIME_BUDGET
+        best_move = possible_moves[0]
+        for depth in range(AI_SEARCH_DEPTH + 1):
+            result = self._search_root(possible_moves, depth, deadline if depth else None)
+            if result is None:
+                break  # Out of time; keep the last completed pass's choice
+            best_move = possible_moves.pop(result[0])
+            possible_moves.insert(0, best_move)
+            if time.monotonic() > deadline:
+                break
+        return best_move
+
+    def _search_root(self, possible_moves: List[List[Tuple[int, int, Tile]]], depth: int,
+                     deadline: Optional[float]) -> Optional[Tuple[int, float]]:
+        """Index and value of the best AI move with MiniMax to the given depth below it
+        (None if the deadline passes first)"""
+        validate_and_score = self._validate_and_score
+        apply_move = self._apply_move
+        undo_move = self._undo_move
+        minimax = self.minimax
         best_score = -float('inf')
-        best_move = None
+        best_index = None
         
-        # Use MiniMax to find best move (limited depth for performance)
-        for move in possible_moves:
-            # Save current state
-            old_board = self.board.copy()
-            old_hands = [p["hand"].copy() for p in self.players]
-            old_scores = [p["score"] for p in self.players]
-            old_player = self.current_player
+        for index, move in enumerate(possible_moves):
+            if deadline is not None and time.monotonic() > deadline:
+                return None
             
-            # Make move temporarily
-            self.make_move(move)
-            move_score = self.minimax(depth=2, alpha=-float('inf'), beta=float('inf'), is_maximizing=False)
+            valid, _, score = validate_and_score(move)
+            if not valid:
+                continue
             
-            # Restore state
-            self.board = old_board
-            for i, p in enumerate(self.players):
-                p["hand"] = old_hands[i]
-                p["score"] = old_scores[i]
-            self.current_player = old_player
-            self.game_state = GameState.AI_TURN
+            # Make move temporarily
+            record = apply_move(move, score)
+            # Only moves beating the best so far matter, so the best score so far bounds the search
+            move_score = minimax(depth=depth, alpha=best_score, beta=float('inf'), is_maximizing=False)
+            undo_move(record)
             
             if move_score > best_score:
                 best_score = move_score
-                best_move = move
-        
-        if best_move:
-            success, score, msg = self.make_move(best_move)
-            if success:
-                return True, score, f"AI placed tile(s) scoring {score} points"
+                best_index = index
         
         # Fallback: use first valid move if MiniMax fails
-        for move in possible_moves:
-            success, score, msg = self.make_move(move)
-            if success:
-                return True, score, f"AI placed tile(s) scoring {score} points"
+        if best_index is None:
+            return 0, best_score
+        return best_index, best_score
+
+    def play_ai_move(self, move: Optional[List[Tuple[int, int, Tile]]]) -> Tuple[bool, int, str]:
+        """Play a move picked by find_ai_move, passing if there is none"""
+        if move is None:
+            self.pass_turn()
+            return False, 0, "AI passed (no valid moves)"
+        
+        success, score, msg = self.make_move(move)
+        if success:
+            return True, score, f"AI placed tile(s) scoring {score} points"
         
         self.pass_turn()
         return False, 0, "AI passed"
 
+    def ai_make_move(self) -> Tuple[bool, int, str]:
+        """AI makes a move using MiniMax algorithm"""
+        return self.play_ai_move(self.find_ai_move())
+
 # ============================================================================
 # GAME VIEW - BUTTONS ON LEFT SIDE
 # ============================================================================
@@ -528,6 +860,63 @@ class QGame(arcade.Window):
         super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, resizable=True)
         arcade.set_background_color(BG_COLOR)
         
+        # Game and per-game UI state
+        self.reset_game()
+        self.button_actions = {"PLACE": self.place_tiles, "CLEAR": self.clear_selection, "PASS": self.pass_turn}
+        
+        # The AI searches a snapshot of the game on a worker thread; on_update plays the result
+        self.ai_executor = ThreadPoolExecutor(max_workers=1)
+        self.animation_time = 0
+        # Animation phases shared by everything drawn in a frame; on_draw recomputes them each frame
+        self.pulse_slow = self.pulse = self.pulse_fast = 0.0
+        self.blink = True
+        self.debug_display = False
+        self.debug_key = None  # Values the debug line was last built from
+        self.show_welcome = True
+        
+        # Dark theme background elements, batched so they draw with a single call
+        self.particle_batch = pyglet.graphics.Batch()
+        # Kept as parallel lists of circles and their speeds rather than one dict per particle
+        self.particles = []
+        self.particle_speeds = []
+        for _ in range(30):  # Fewer particles for performance
+            x = random.randint(0, SCREEN_WIDTH)
+            y = random.randint(0, SCREEN_HEIGHT)
+            size = random.uniform(1, 2)
+            speed = random.uniform(0.1, 0.3)
+            brightness = random.uniform(0.3, 0.8)
+            self.particles.append(pyglet.shapes.Circle(x, y, size, color=(100, 100, 150, int(brightness * 255)),
+                                                       batch=self.particle_batch))
+            self.particle_speeds.append(speed)
+        
+        # Pre-rendered tile images, keyed by (tile id, size_ratio)
+        self.tile_textures = {}
+        
+        # Static board and panel geometry is batched once and drawn with a single call per screen
+        self.board_shapes = self.create_board_shapes()
+        self.welcome_shapes = self.create_welcome_shapes()
+        self.game_over_shapes = self.create_game_over_shapes()
+        
+        # Sprites of the tiles on the board, rebuilt only when the board hash changes
+        self.board_sprites = arcade.SpriteList()
+        self.board_sprites_hash = None
+        
+        # Backgrounds and sprites of the pending placements, rebuilt only when they change
+        self.preview_shapes = arcade.ShapeElementList()
+        self.preview_sprites = arcade.SpriteList()
+        self.preview_key = ()
+        
+        # Text labels are laid out once; dynamic ones only get their text or color updated
+        self.create_texts()
+        
+        # Button and hand panel geometry, rebuilt only when what it shows changes
+        self.ui_shapes = arcade.ShapeElementList()
+        self.badge_shapes = arcade.ShapeElementList()
+        self.hand_sprites = arcade.SpriteList()
+        self.ui_shapes_key = None
+
+    def reset_game(self):
+        """Start a new game, keeping the window and its cached drawing resources"""
         self.game = QGameEngine()
         self.selected_tile = None
         self.placement_positions = []
@@ -538,24 +927,201 @@ class QGame(arcade.Window):
         self.hover_pos = None
         self.hover_button = None
         self.ai_thinking = False
-        self.animation_time = 0
-        self.debug_display = False
-        self.show_welcome = True
+        self.ai_future: Optional[Future] = None
+        self.ai_move_at = 0  # animation_time before which the AI's move is held back, for visual effect
+
+    def update_board_sprites(self, grid_half: int):
+        """Rebuild the sprites of the tiles on the visible part of the board"""
+        self.board_sprites.clear()
+        for (row, col), tile in self.game.board.items():
+            if abs(row) <= grid_half and abs(col) <= grid_half:
+                self.board_sprites.append(arcade.Sprite(
+                    texture=self.get_tile_texture(tile, 0.7),
+                    center_x=BOARD_OFFSET_X + col * TILE_SIZE,
+                    center_y=BOARD_OFFSET_Y + row * TILE_SIZE,
+                ))
+        self.board_sprites_hash = self.game.board_hash
+
+    def update_preview_sprites(self):
+        """Rebuild the highlighted backgrounds and tile sprites of the pending placements"""
+        self.preview_shapes = arcade.ShapeElementList()
+        self.preview_sprites.clear()
+        for row, col, tile in self.placement_positions:
+            x = BOARD_OFFSET_X + col * TILE_SIZE
+            y = BOARD_OFFSET_Y + row * TILE_SIZE
+            self.preview_shapes.append(arcade.create_rectangle_filled(x, y, TILE_SIZE - 4, TILE_SIZE - 4,
+                                                                      HIGHLIGHT_COLOR))
+            self.preview_sprites.append(arcade.Sprite(texture=self.get_tile_texture(tile, 0.7),
+                                                      center_x=x, center_y=y))
+
+    def create_board_shapes(self) -> arcade.ShapeElementList:
+        """Build the board shadow, background, grid cells and score panel background as one shape list"""
+        shapes = arcade.ShapeElementList()
+        board_size = 350
         
-        # Dark theme background elements
-        self.particles = []
-        for _ in range(30):  # Fewer particles for performance
-            self.particles.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'size': random.uniform(1, 2),
-                'speed': random.uniform(0.1, 0.3),
-                'brightness': random.uniform(0.3, 0.8)
-            })
+        # Shadow
+        shadow_offset = 3
+        shapes.append(arcade.create_rectangle_filled(BOARD_OFFSET_X + shadow_offset, BOARD_OFFSET_Y - shadow_offset,
+                                                     board_size, board_size, (20, 20, 30)))
+        
+        # Main board
+        shapes.append(arcade.create_rectangle_filled(BOARD_OFFSET_X, BOARD_OFFSET_Y, board_size, board_size, PANEL_COLOR))
+        
+        # Grid cells
+        grid_half = 4
+        for row in range(-grid_half, grid_half + 1):
+            for col in range(-grid_half, grid_half + 1):
+                x = BOARD_OFFSET_X + col * TILE_SIZE
+                y = BOARD_OFFSET_Y + row * TILE_SIZE
+                cell_color = GRID_HIGHLIGHT if (row + col) % 2 == 0 else GRID_COLOR
+                shapes.append(arcade.create_rectangle_filled(x, y, TILE_SIZE - 2, TILE_SIZE - 2, cell_color))
+                shapes.append(arcade.create_rectangle_outline(x, y, TILE_SIZE - 2, TILE_SIZE - 2, (60, 60, 80), 1))
+        
+        # Score panel in the top right corner
+        panel_x = SCREEN_WIDTH - 140
+        panel_y = SCREEN_HEIGHT - 140
+        shapes.append(arcade.create_rectangle_filled(panel_x, panel_y, 260, 155, (35, 35, 50, 230)))
+        shapes.append(arcade.create_rectangle_outline(panel_x, panel_y, 260, 155, ACCENT_COLOR, 2))
+        
+        return shapes
+
+    def create_welcome_shapes(self) -> arcade.ShapeElementList:
+        """Build the welcome screen's overlay and description panel as one shape list"""
+        shapes = arcade.ShapeElementList()
+        
+        # Dark overlay for readability
+        shapes.append(arcade.create_rectangle_filled(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                                     SCREEN_WIDTH, SCREEN_HEIGHT, (30, 30, 45, 230)))
+        
+        # Compact game description
+        desc_panel_y = SCREEN_HEIGHT // 2
+        shapes.append(arcade.create_rectangle_filled(SCREEN_WIDTH // 2, desc_panel_y, 550, 250, (40, 40, 55, 240)))
+        shapes.append(arcade.create_rectangle_outline(SCREEN_WIDTH // 2, desc_panel_y, 550, 250, ACCENT_COLOR, 2))
+        
+        return shapes
+
+    def create_game_over_shapes(self) -> arcade.ShapeElementList:
+        """Build the game over screen's overlay and main panel as one shape list"""
+        shapes = arcade.ShapeElementList()
+        shapes.append(arcade.create_rectangle_filled(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                                     SCREEN_WIDTH, SCREEN_HEIGHT, (0, 0, 0, 200)))
+        
+        # Main panel
+        panel_width, panel_height = 400, 280
+        shapes.append(arcade.create_rectangle_filled(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                                     panel_width, panel_height, PANEL_COLOR))
+        shapes.append(arcade.create_rectangle_outline(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                                      panel_width, panel_height, ACCENT_COLOR, 3))
+        
+        return shapes
+
+    def create_texts(self):
+        """Build the arcade.Text labels for every screen"""
+        # Welcome screen
+        title_y = SCREEN_HEIGHT - 150
+        self.txt_title = arcade.Text("Q GAME", SCREEN_WIDTH // 2, title_y, ACCENT_COLOR, 48,
+                                     bold=True, anchor_x="center", font_name="Arial")
+        self.txt_subtitle = arcade.Text("Strategic Tile Placement", SCREEN_WIDTH // 2, title_y - 50, TEXT_COLOR, 20,
+                                        bold=True, anchor_x="center")
+        
+        # Compact rules
+        rules = [
+            "CREATE LINES WHERE:",
+            "• Same COLOR, different SHAPES",
+            "• Same SHAPE, different COLORS",
+            "",
+            "SCORE points for each tile in lines",
+            "Longer lines = more points!",
+            "",
+            "Place tiles, connect to board,",
+            "and challenge the AI!"
+        ]
+        desc_panel_y = SCREEN_HEIGHT // 2
+        self.rule_texts = []
+        for i, line in enumerate(rules):
+            if not line:
+                continue
+            color = TEXT_COLOR
+            size = 14
+            if "CREATE" in line or "SCORE" in line:
+                color = ACCENT_COLOR
+                size = 15
+            self.rule_texts.append(arcade.Text(line, SCREEN_WIDTH // 2, desc_panel_y + 90 - i * 22, color, size,
+                                               anchor_x="center", anchor_y="center", font_name="Arial"))
+        
+        button_y = SCREEN_HEIGHT // 2 - 180
+        self.txt_start = arcade.Text("START GAME", SCREEN_WIDTH // 2, button_y, (255, 255, 255), 18,
+                                     bold=True, anchor_x="center", anchor_y="center", font_name="Arial")
+        self.txt_start_hint = arcade.Text("Press SPACE or ENTER to start", SCREEN_WIDTH // 2, 50, TEXT_COLOR, 14,
+                                          anchor_x="center", font_name="Arial")
+        
+        # Score panel
+        panel_x = SCREEN_WIDTH - 140
+        panel_y = SCREEN_HEIGHT - 140
+        self.txt_info_title = arcade.Text("GAME INFO", panel_x, panel_y + 50, (255, 255, 255), 18,
+                                          bold=True, anchor_x="center", font_name="Arial")
+        self.txt_player_score = arcade.Text("Player: 0", panel_x - 110, panel_y + 15,
+                                            (255, 255, 255), 16, font_name="Arial")
+        self.txt_ai_score = arcade.Text("AI: 0", panel_x - 110, panel_y - 10,
+                                        (255, 255, 255), 16, font_name="Arial")
+        self.txt_tiles = arcade.Text("Tiles: 0", panel_x - 110, panel_y - 30,
+                                     (255, 255, 255), 14, font_name="Arial")
+        self.txt_passes = arcade.Text("Passes: 0/2", panel_x - 110, panel_y - 50,
+                                      (255, 255, 255), 14, font_name="Arial")
+        self.txt_turn = arcade.Text("Your Turn", panel_x, panel_y - 75, PLAYER_COLOR, 18,
+                                    bold=True, anchor_x="center", font_name="Arial")
+        
+        # Buttons and hand
+        self.txt_buttons = {
+            text: arcade.Text(text, x, y, (255, 255, 255), 16,
+                              anchor_x="center", anchor_y="center", bold=True, font_name="Arial")
+            for text, x, y in BUTTON_LAYOUT
+        }
+        hand_panel_y = 80
+        self.txt_hand_title = arcade.Text("YOUR HAND", SCREEN_WIDTH // 2, hand_panel_y + 40, (255, 255, 255), 18,
+                                          bold=True, anchor_x="center", font_name="Arial")
+        self.txt_hand_empty = arcade.Text("No tiles left!", SCREEN_WIDTH // 2, hand_panel_y, (255, 255, 255), 16,
+                                          anchor_x="center", anchor_y="center", font_name="Arial")
+        self.txt_badges = [
+            arcade.Text(str(i + 1), 0, 0, (255, 255, 255), 10,
+                        bold=True, anchor_x="center", anchor_y="center", font_name="Arial")
+            for i in range(6)
+        ]
+        self.txt_ai_thinking = arcade.Text("AI Thinking", SCREEN_WIDTH // 2, 150, AI_COLOR, 18,
+                                           anchor_x="center", bold=True, font_name="Arial")
+        self.ai_thinking_dots = 0  # Dots currently shown after "AI Thinking"
+        
+        # Message box and debug line
+        self.txt_message = arcade.Text("", SCREEN_WIDTH // 2, SCREEN_HEIGHT - 25, (255, 255, 255), 14,
+                                       anchor_x="center", anchor_y="center", bold=True, font_name="Arial")
+        self.txt_debug = arcade.Text("", 10, 30, (255, 255, 0), 10, font_name="Arial")
+        
+        # Game over screen
+        self.txt_game_over = arcade.Text("GAME OVER", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90,
+                                         ACCENT_COLOR, 32, bold=True, anchor_x="center", font_name="Arial")
+        self.txt_winner = arcade.Text("", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50,
+                                      ACCENT_COLOR, 28, bold=True, anchor_x="center", font_name="Arial")
+        self.txt_winner_sub = arcade.Text("", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20,
+                                          (255, 255, 255), 16, bold=True, anchor_x="center", font_name="Arial")
+        y = SCREEN_HEIGHT // 2 - 20
+        self.txt_final_player = arcade.Text("Player: 0", SCREEN_WIDTH // 2 - 80, y,
+                                            (255, 255, 255), 20, anchor_x="center", anchor_y="center", bold=True,
+                                            font_name="Arial")
+        self.txt_final_ai = arcade.Text("AI: 0", SCREEN_WIDTH // 2 + 80, y,
+                                        (255, 255, 255), 20, anchor_x="center", anchor_y="center", bold=True,
+                                        font_name="Arial")
+        self.txt_play_again = arcade.Text("Click anywhere to play again", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60,
+                                          (255, 255, 255), 14, anchor_x="center", font_name="Arial")
 
     def on_draw(self):
         self.clear()
         
+        # Animation phases shared by everything drawn this frame
+        self.pulse_slow = abs(math.sin(self.animation_time * 1.5))
+        self.pulse = abs(math.sin(self.animation_time * 2))
+        self.pulse_fast = abs(math.sin(self.animation_time * 3))
+        self.blink = int(self.animation_time * 2) % 2 == 0
+        
         # Draw dark background with particles
         self.draw_dark_background()
         
@@ -573,22 +1139,17 @@ class QGame(arcade.Window):
                 self.draw_game_over()
 
     def draw_dark_background(self):
-        # Draw subtle particles
-        for particle in self.particles:
-            alpha = int(particle['brightness'] * 255)
-            arcade.draw_circle_filled(
-                particle['x'], particle['y'], particle['size'], 
-                (100, 100, 150, alpha)
-            )
+        # Draw subtle particles; pyglet needs its own GL state set up around the batch
+        with self.ctx.pyglet_rendering():
+            self.particle_batch.draw()
 
     def draw_welcome_screen(self):
-        # Dark overlay for readability
-        arcade.draw_rectangle_filled(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 
-                                   SCREEN_WIDTH, SCREEN_HEIGHT, (30, 30, 45, 230))
+        # Dark overlay and description panel (static, pre-batched)
+        self.welcome_shapes.draw()
         
         # Compact title
         title_y = SCREEN_HEIGHT - 150
-        pulse = abs(math.sin(self.animation_time * 2)) * 0.3 + 0.7
+        pulse = self.pulse * 0.3 + 0.7
         
         # Main title with glow effect
         title_color = (
@@ -598,44 +1159,19 @@ class QGame(arcade.Window):
         )
         
         # Title
-        arcade.draw_text("Q GAME", SCREEN_WIDTH // 2, title_y, title_color, 48, 
-                        bold=True, anchor_x="center", font_name="Arial")
+        self.txt_title.color = title_color
+        self.txt_title.draw()
         
         # Subtitle
-        arcade.draw_text("Strategic Tile Placement", SCREEN_WIDTH // 2, title_y - 50, TEXT_COLOR, 20, 
-                        bold=True, anchor_x="center")
-        
-        # Compact game description
-        desc_panel_y = SCREEN_HEIGHT // 2
-        arcade.draw_rectangle_filled(SCREEN_WIDTH // 2, desc_panel_y, 550, 250, (40, 40, 55, 240))
-        arcade.draw_rectangle_outline(SCREEN_WIDTH // 2, desc_panel_y, 550, 250, ACCENT_COLOR, 2)
+        self.txt_subtitle.draw()
         
         # Compact rules
-        rules = [
-            "CREATE LINES WHERE:",
-            "• Same COLOR, different SHAPES",
-            "• Same SHAPE, different COLORS",
-            "",
-            "SCORE points for each tile in lines",
-            "Longer lines = more points!",
-            "",
-            "Place tiles, connect to board,",
-            "and challenge the AI!"
-        ]
-        
-        for i, line in enumerate(rules):
-            color = TEXT_COLOR
-            size = 14
-            if "CREATE" in line or "SCORE" in line:
-                color = ACCENT_COLOR
-                size = 15
-                
-            arcade.draw_text(line, SCREEN_WIDTH // 2, desc_panel_y + 90 - i * 22, color, size, 
-                           anchor_x="center", anchor_y="center", font_name="Arial")
+        for text in self.rule_texts:
+            text.draw()
         
         # Start button
         button_y = SCREEN_HEIGHT // 2 - 180
-        pulse = abs(math.sin(self.animation_time * 2)) * 0.2 + 0.8
+        pulse = self.pulse * 0.2 + 0.8
         
         # Button with gradient effect
         if self.hover_button == "START":
@@ -652,29 +1188,21 @@ class QGame(arcade.Window):
         arcade.draw_rectangle_outline(SCREEN_WIDTH // 2, button_y, 180, 45, ACCENT_COLOR, 2)
         
         # Button text
-        arcade.draw_text("START GAME", SCREEN_WIDTH // 2, button_y, (255, 255, 255), 18, 
-                        bold=True, anchor_x="center", anchor_y="center", font_name="Arial")
+        self.txt_start.draw()
         
         # Footer with instructions
-        blink = int(self.animation_time * 2) % 2 == 0
-        if blink:
-            arcade.draw_text("Press SPACE or ENTER to start", SCREEN_WIDTH // 2, 50, TEXT_COLOR, 14, 
-                            anchor_x="center", font_name="Arial")
+        if self.blink:
+            self.txt_start_hint.draw()
 
     def draw_game_board(self):
         # Smaller board for compact layout
         board_size = 350
         
-        # Shadow
-        shadow_offset = 3
-        arcade.draw_rectangle_filled(BOARD_OFFSET_X + shadow_offset, BOARD_OFFSET_Y - shadow_offset, 
-                                   board_size, board_size, (20, 20, 30))
-        
-        # Main board
-        arcade.draw_rectangle_filled(BOARD_OFFSET_X, BOARD_OFFSET_Y, board_size, board_size, PANEL_COLOR)
+        # Shadow, main board, grid cells and score panel background (static, pre-batched)
+        self.board_shapes.draw()
         
         # Border with glow
-        border_pulse = abs(math.sin(self.animation_time * 1.5)) * 0.3 + 0.7
+        border_pulse = self.pulse_slow * 0.3 + 0.7
         border_color = (
             int(ACCENT_COLOR[0] * border_pulse),
             int(ACCENT_COLOR[1] * border_pulse),
@@ -684,175 +1212,149 @@ class QGame(arcade.Window):
         
         # Smaller grid
         grid_half = 4  # Reduced from 5 to fit better
+        
+        # Placed tiles only change when a move is played
+        if self.board_sprites_hash != self.game.board_hash:
+            self.update_board_sprites(grid_half)
+        self.board_sprites.draw()
+        
+        # Valid positions are only highlighted on the player's turn, all in the same pulsing color
+        valid_positions = self.game.valid_positions if self.game.game_state == GameState.PLAYER_TURN else ()
+        highlight_pulse = self.pulse_fast * 0.5 + 0.5
+        highlight_color = (
+            int(VALID_COLOR[0] * highlight_pulse),
+            int(VALID_COLOR[1] * highlight_pulse),
+            int(VALID_COLOR[2] * highlight_pulse)
+        )
+        hover_pos = self.hover_pos if self.selected_tile else None
         for row in range(-grid_half, grid_half + 1):
             for col in range(-grid_half, grid_half + 1):
                 x = BOARD_OFFSET_X + col * TILE_SIZE
                 y = BOARD_OFFSET_Y + row * TILE_SIZE
                 
-                # Grid cell
-                cell_color = GRID_HIGHLIGHT if (row + col) % 2 == 0 else GRID_COLOR
-                arcade.draw_rectangle_filled(x, y, TILE_SIZE - 2, TILE_SIZE - 2, cell_color)
-                arcade.draw_rectangle_outline(x, y, TILE_SIZE - 2, TILE_SIZE - 2, (60, 60, 80), 1)
-                
-                # Draw existing tiles
-                if (row, col) in self.game.board:
-                    tile = self.game.board[(row, col)]
-                    self.draw_tile(x, y, tile)
-                
                 # Highlight valid positions
-                valid_positions = self.game.get_valid_positions()
-                if (self.game.game_state == GameState.PLAYER_TURN and 
-                    (row, col) in valid_positions):
-                    highlight_pulse = abs(math.sin(self.animation_time * 3)) * 0.5 + 0.5
-                    highlight_color = (
-                        int(VALID_COLOR[0] * highlight_pulse),
-                        int(VALID_COLOR[1] * highlight_pulse),
-                        int(VALID_COLOR[2] * highlight_pulse)
-                    )
+                if (row, col) in valid_positions:
                     arcade.draw_rectangle_filled(x, y, TILE_SIZE - 6, TILE_SIZE - 6, highlight_color)
                 
                 # Highlight hover position
-                if self.hover_pos == (row, col) and self.selected_tile:
+                if hover_pos == (row, col):
                     arcade.draw_rectangle_outline(x, y, TILE_SIZE - 2, TILE_SIZE - 2, ACCENT_COLOR, 2)
         
         # Draw placement preview
-        for row, col, tile in self.placement_positions:
-            x = BOARD_OFFSET_X + col * TILE_SIZE
-            y = BOARD_OFFSET_Y + row * TILE_SIZE
-            arcade.draw_rectangle_filled(x, y, TILE_SIZE - 4, TILE_SIZE - 4, HIGHLIGHT_COLOR)
-            self.draw_tile(x, y, tile)
-
-    def draw_tile(self, x, y, tile, size_ratio=0.7):
-        """Tile drawing for dark theme"""
-        color = tile.color.value
-        size = (TILE_SIZE - 8) * size_ratio  # Adjusted for smaller tiles
-        
-        # Tile background
-        arcade.draw_rectangle_filled(x, y, TILE_SIZE - 4, TILE_SIZE - 4, (50, 50, 60))
-        arcade.draw_rectangle_outline(x, y, TILE_SIZE - 4, TILE_SIZE - 4, (80, 80, 100), 1)
-        
-        # Inner background
-        arcade.draw_rectangle_filled(x, y, TILE_SIZE - 6, TILE_SIZE - 6, (30, 30, 40))
-        
-        # Draw shape
-        if tile.shape == Shape.CIRCLE:
-            arcade.draw_circle_filled(x, y, size / 2, color)
-            arcade.draw_circle_outline(x, y, size / 2, (255, 255, 255), 1)
-        elif tile.shape == Shape.SQUARE:
-            arcade.draw_rectangle_filled(x, y, size, size, color)
-            arcade.draw_rectangle_outline(x, y, size, size, (255, 255, 255), 1)
-        elif tile.shape == Shape.STAR:
-            self.draw_star(x, y, size / 2, color)
-        elif tile.shape == Shape.DIAMOND:
-            points = [(x, y + size/2), (x + size/2, y), (x, y - size/2), (x - size/2, y)]
-            arcade.draw_polygon_filled(points, color)
-            arcade.draw_polygon_outline(points, (255, 255, 255), 1)
-        elif tile.shape == Shape.CLOVER:
-            self.draw_clover(x, y, size / 3, color)
-        elif tile.shape == Shape.CROSS:
-            arcade.draw_rectangle_filled(x, y, size * 0.7, size * 0.2, color)
-            arcade.draw_rectangle_filled(x, y, size * 0.2, size * 0.7, color)
-        
-        # Border
-        arcade.draw_rectangle_outline(x, y, TILE_SIZE - 4, TILE_SIZE - 4, (200, 200, 220), 1)
-
-    def draw_star(self, x, y, size, color):
-        points = []
-        for i in range(10):
-            angle = math.pi / 2 + i * 2 * math.pi / 10
-            r = size if i % 2 == 0 else size / 2
-            points.append((x + r * math.cos(angle), y + r * math.sin(angle)))
-        arcade.draw_polygon_filled(points, color)
-        arcade.draw_polygon_outline(points, (255, 255, 255), 1)
-
-    def draw_clover(self, x, y, size, color):
-        arcade.draw_circle_filled(x, y + size, size, color)
-        arcade.draw_circle_filled(x - size, y, size, color)
-        arcade.draw_circle_filled(x + size, y, size, color)
-        arcade.draw_circle_filled(x, y - size, size, color)
+        preview_key = tuple(self.placement_positions)
+        if self.preview_key != preview_key:
+            self.update_preview_sprites()
+            self.preview_key = preview_key
+        self.preview_shapes.draw()
+        self.preview_sprites.draw()
+
+    def get_tile_texture(self, tile, size_ratio) -> arcade.Texture:
+        """Get the pre-rendered texture for a tile, rendering it on first use"""
+        key = (tile._id, size_ratio)
+        texture = self.tile_textures.get(key)
+        if texture is None:
+            texture = self.create_tile_texture(tile.shape, tile.color, size_ratio)
+            self.tile_textures[key] = texture
+        return texture
+
+    def create_tile_texture(self, shape, color, size_ratio) -> arcade.Texture:
+        """Render one tile into a texture (the shape is supersampled for smooth edges)"""
+        tile_px = TILE_SIZE - 3  # Tile background plus its 1px border, kept even so edges stay pixel-aligned
+        scale = 4
+        
+        # Shape layer, drawn at 4x and scaled down (y grows downwards in image space)
+        shape_layer = Image.new("RGBA", (tile_px * scale, tile_px * scale), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(shape_layer)
+        center = tile_px * scale / 2
+        size = (TILE_SIZE - 8) * size_ratio * scale  # Adjusted for smaller tiles
+        SHAPE_PAINTERS[shape](draw, center, size, COLOR_RGB[color], (255, 255, 255), scale)
+        
+        # Tile background, inner background, shape, then border
+        image = Image.new("RGBA", (tile_px, tile_px), (50, 50, 60, 255))
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((2, 2, tile_px - 3, tile_px - 3), fill=(30, 30, 40))
+        image.alpha_composite(shape_layer.resize((tile_px, tile_px), Image.Resampling.LANCZOS))
+        draw.rectangle((0, 0, tile_px - 1, tile_px - 1), outline=(200, 200, 220))
+        
+        return arcade.Texture(f"tile_{shape.name}_{color.name}_{size_ratio}", image, hit_box_algorithm=None)
 
     def draw_ui(self):
         # SCORE DISPLAY IN TOP RIGHT CORNER - COMPACT
         self.draw_score_panel()
         
-        # DRAW BUTTONS ON LEFT SIDE
-        self.draw_buttons()
-        
-        # Draw hand area
+        # Buttons and hand are only shown on the player's turn
         if self.game.game_state == GameState.PLAYER_TURN:
+            ui_key = (tuple(self.game.players[0]["hand"]), self.selected_tile, self.hover_button,
+                      bool(self.placement_positions))
+            if self.ui_shapes_key != ui_key:
+                self.update_ui_shapes()
+                self.ui_shapes_key = ui_key
+            self.ui_shapes.draw()
+            
+            # DRAW BUTTONS ON LEFT SIDE
+            self.draw_buttons()
+            
+            # Draw hand area
             self.draw_hand()
         
         # AI thinking indicator
         if self.ai_thinking:
-            dots = "." * (int(self.animation_time * 3) % 4)
-            arcade.draw_text(f"AI Thinking{dots}", SCREEN_WIDTH // 2, 150, AI_COLOR, 18, 
-                           anchor_x="center", bold=True, font_name="Arial")
+            dots = int(self.animation_time * 3) % 4
+            if dots != self.ai_thinking_dots:
+                self.txt_ai_thinking.text = "AI Thinking" + "." * dots
+                self.ai_thinking_dots = dots
+            self.txt_ai_thinking.draw()
 
     def draw_score_panel(self):
         """Larger score information in top right corner"""
         player = self.game.players[0]
         ai = self.game.players[1]
         
-        # Position in top right corner - MAKE PANEL LARGER
-        panel_x = SCREEN_WIDTH - 140
-        panel_y = SCREEN_HEIGHT - 140
-        
-        # LARGER Background panel
-        arcade.draw_rectangle_filled(panel_x, panel_y, 260, 155, (35, 35, 50, 230))
-        arcade.draw_rectangle_outline(panel_x, panel_y, 260, 155, ACCENT_COLOR, 2)
+        # The LARGER background panel is drawn with the board shapes
         
         # Title - make larger
-        arcade.draw_text("GAME INFO", panel_x, panel_y + 50, (255, 255, 255), 18,
-                        bold=True, anchor_x="center", font_name="Arial")
+        self.txt_info_title.draw()
         
         # Player Score - LARGER TEXT
-        arcade.draw_text(f"Player: {player['score']}", panel_x - 110, panel_y + 15,
-                        (255, 255, 255), 16, font_name="Arial")
+        self.txt_player_score.text = f"Player: {player['score']}"
+        self.txt_player_score.draw()
         
         # AI Score - LARGER TEXT  
-        arcade.draw_text(f"AI: {ai['score']}", panel_x - 110, panel_y - 10,
-                        (255, 255, 255), 16, font_name="Arial")
+        self.txt_ai_score.text = f"AI: {ai['score']}"
+        self.txt_ai_score.draw()
         
         # Tiles in bag - LARGER TEXT
-        arcade.draw_text(f"Tiles: {len(self.game.tile_bag)}", panel_x - 110, panel_y - 30,
-                        (255, 255, 255), 14, font_name="Arial")
+        self.txt_tiles.text = f"Tiles: {self.game.tiles_remaining()}"
+        self.txt_tiles.draw()
         
         # Passes - LARGER TEXT
-        arcade.draw_text(f"Passes: {self.game.consecutive_passes}/2", panel_x - 110, panel_y - 50,
-                        (255, 255, 255), 14, font_name="Arial")
+        self.txt_passes.text = f"Passes: {self.game.consecutive_passes}/2"
+        self.txt_passes.draw()
         
         # Turn indicator - LARGER TEXT
         turn_text = "Your Turn" if self.game.game_state == GameState.PLAYER_TURN else "AI's Turn"
         turn_color = PLAYER_COLOR if self.game.game_state == GameState.PLAYER_TURN else AI_COLOR
         
         # Pulse effect for current turn
-        pulse = abs(math.sin(self.animation_time * 3)) * 0.3 + 0.7
+        pulse = self.pulse_fast * 0.3 + 0.7
         pulse_color = (
             int(turn_color[0] * pulse),
             int(turn_color[1] * pulse), 
             int(turn_color[2] * pulse)
         )
         
-        arcade.draw_text(turn_text, panel_x, panel_y - 75, pulse_color, 18,
-                        bold=True, anchor_x="center", font_name="Arial")
+        self.txt_turn.text = turn_text
+        self.txt_turn.color = pulse_color
+        self.txt_turn.draw()
 
-    def draw_buttons(self):
-        """Draw buttons vertically on the left side"""
-        if self.game.game_state != GameState.PLAYER_TURN:
-            return
-            
-        # Position on left side
-        button_x = 100
-        start_y = 400  # Start position for first button
-        
-        buttons = [
-            ("PLACE", button_x, start_y, len(self.placement_positions) > 0),
-            ("CLEAR", button_x, start_y - 60, len(self.placement_positions) > 0),
-            ("PASS", button_x, start_y - 120, True)
-        ]
-        
-        for text, x, y, enabled in buttons:
-            if enabled:
+    def update_ui_shapes(self):
+        """Rebuild the button, hand panel and hand badge shapes and the hand tile sprites, and update their labels"""
+        shapes = arcade.ShapeElementList()
+        
+        # Buttons on the left side
+        has_placements = len(self.placement_positions) > 0
+        for text, x, y in BUTTON_LAYOUT:
+            if text == "PASS" or has_placements:
                 color = BUTTON_HOVER_COLOR if self.hover_button == text else BUTTON_COLOR
                 text_color = (255, 255, 255)
                 border_color = ACCENT_COLOR
@@ -861,48 +1363,62 @@ class QGame(arcade.Window):
                 text_color = (150, 150, 150)
                 border_color = (80, 80, 100)
             
-            # Draw buttons
-            arcade.draw_rectangle_filled(x, y, 100, 40, color)
-            arcade.draw_rectangle_outline(x, y, 100, 40, border_color, 2)
+            shapes.append(arcade.create_rectangle_filled(x, y, 100, 40, color))
+            shapes.append(arcade.create_rectangle_outline(x, y, 100, 40, border_color, 2))
             
-            # Button text
-            arcade.draw_text(text, x, y, text_color, 16, 
-                           anchor_x="center", anchor_y="center", bold=True, font_name="Arial")
-
-    def draw_hand(self):
-        player = self.game.players[0]
+            self.txt_buttons[text].color = text_color
         
         # Compact hand panel
         hand_panel_y = 80
-        arcade.draw_rectangle_filled(SCREEN_WIDTH // 2, hand_panel_y, SCREEN_WIDTH, 120, (30, 30, 45))
-        arcade.draw_rectangle_outline(SCREEN_WIDTH // 2, hand_panel_y, SCREEN_WIDTH, 120, ACCENT_COLOR, 2)
+        shapes.append(arcade.create_rectangle_filled(SCREEN_WIDTH // 2, hand_panel_y, SCREEN_WIDTH, 120, (30, 30, 45)))
+        shapes.append(arcade.create_rectangle_outline(SCREEN_WIDTH // 2, hand_panel_y, SCREEN_WIDTH, 120,
+                                                      ACCENT_COLOR, 2))
+        
+        # Highlight selected tile, and a number badge in the corner of every tile (drawn over the tiles)
+        badge_shapes = arcade.ShapeElementList()
+        self.hand_sprites.clear()
+        hand = self.game.players[0]["hand"]
+        start_x = SCREEN_WIDTH // 2 - (len(hand) * (TILE_SIZE + 8)) // 2
+        for i, tile in enumerate(hand):
+            x = start_x + i * (TILE_SIZE + 8)
+            if tile == self.selected_tile:
+                shapes.append(arcade.create_rectangle_filled(x, hand_panel_y, TILE_SIZE + 8, TILE_SIZE + 8,
+                                                             HIGHLIGHT_COLOR))
+                shapes.append(arcade.create_rectangle_outline(x, hand_panel_y, TILE_SIZE + 8, TILE_SIZE + 8,
+                                                              ACCENT_COLOR, 2))
+            
+            self.hand_sprites.append(arcade.Sprite(texture=self.get_tile_texture(tile, 0.75),
+                                                   center_x=x, center_y=hand_panel_y))
+            
+            badge_x = x - TILE_SIZE//2 + 5
+            badge_y = hand_panel_y + TILE_SIZE//2 - 5
+            badge_shapes.append(arcade.create_rectangle_filled(badge_x, badge_y, 16, 16, (20, 20, 35)))
+            badge_shapes.append(arcade.create_rectangle_outline(badge_x, badge_y, 16, 16, ACCENT_COLOR, 1))
+            self.txt_badges[i].position = (badge_x, badge_y)
+        
+        self.ui_shapes = shapes
+        self.badge_shapes = badge_shapes
+
+    def draw_buttons(self):
+        """Draw the labels of the buttons vertically on the left side (their shapes are in ui_shapes)"""
+        for label in self.txt_buttons.values():
+            label.draw()
+
+    def draw_hand(self):
+        player = self.game.players[0]
         
-        arcade.draw_text("YOUR HAND", SCREEN_WIDTH // 2, hand_panel_y + 40, (255, 255, 255), 18, 
-                        bold=True, anchor_x="center", font_name="Arial")
+        # Compact hand panel (the panel and selection highlight are in ui_shapes)
+        self.txt_hand_title.draw()
         
         if not player["hand"]:
-            arcade.draw_text("No tiles left!", SCREEN_WIDTH // 2, hand_panel_y, (255, 255, 255), 16, 
-                           anchor_x="center", anchor_y="center", font_name="Arial")
+            self.txt_hand_empty.draw()
             return
         
-        # Draw tiles in hand
-        start_x = SCREEN_WIDTH // 2 - (len(player["hand"]) * (TILE_SIZE + 8)) // 2
-        for i, tile in enumerate(player["hand"]):
-            x = start_x + i * (TILE_SIZE + 8)
-            y = hand_panel_y
-            
-            # Highlight selected tile
-            if tile == self.selected_tile:
-                arcade.draw_rectangle_filled(x, y, TILE_SIZE + 8, TILE_SIZE + 8, HIGHLIGHT_COLOR)
-                arcade.draw_rectangle_outline(x, y, TILE_SIZE + 8, TILE_SIZE + 8, ACCENT_COLOR, 2)
-            
-            self.draw_tile(x, y, tile, 0.75)
-            
-            # Number indicator
-            arcade.draw_rectangle_filled(x - TILE_SIZE//2 + 5, y + TILE_SIZE//2 - 5, 16, 16, (20, 20, 35))
-            arcade.draw_rectangle_outline(x - TILE_SIZE//2 + 5, y + TILE_SIZE//2 - 5, 16, 16, ACCENT_COLOR, 1)
-            arcade.draw_text(str(i + 1), x - TILE_SIZE//2 + 5, y + TILE_SIZE//2 - 5, 
-                           (255, 255, 255), 10, bold=True, anchor_x="center", anchor_y="center", font_name="Arial")
+        # Draw tiles in hand, then their number indicators (both positioned in update_ui_shapes)
+        self.hand_sprites.draw()
+        self.badge_shapes.draw()
+        for badge in self.txt_badges[:len(player["hand"])]:
+            badge.draw()
 
     def draw_message(self):
         if self.message and self.message_timer > 0:
@@ -912,25 +1428,24 @@ class QGame(arcade.Window):
                                        box_width, 30, (40, 40, 55))
             arcade.draw_rectangle_outline(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 25, 
                                         box_width, 30, ACCENT_COLOR, 2)
-            arcade.draw_text(self.message, SCREEN_WIDTH // 2, SCREEN_HEIGHT - 25, 
-                           (255, 255, 255), 14, anchor_x="center", anchor_y="center", bold=True, font_name="Arial")
+            self.txt_message.text = self.message
+            self.txt_message.draw()
 
     def draw_debug_info(self):
-        debug_text = f"Game State: {self.game.game_state.name}"
-        debug_text += f" | Selected: {self.selected_tile is not None}"
-        debug_text += f" | Placements: {len(self.placement_positions)}"
-        
-        arcade.draw_text(debug_text, 10, 30, (255, 255, 0), 10, font_name="Arial")
+        # Only rebuild the string when one of the values it shows has changed
+        debug_key = (self.game.game_state, self.selected_tile is not None, len(self.placement_positions))
+        if self.debug_key != debug_key:
+            debug_text = f"Game State: {self.game.game_state.name}"
+            debug_text += f" | Selected: {self.selected_tile is not None}"
+            debug_text += f" | Placements: {len(self.placement_positions)}"
+            self.txt_debug.text = debug_text
+            self.debug_key = debug_key
+        
+        self.txt_debug.draw()
 
     def draw_game_over(self):
-        # Compact game over screen
-        arcade.draw_rectangle_filled(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 
-                                  SCREEN_WIDTH, SCREEN_HEIGHT, (0, 0, 0, 200))
-        
-        # Main panel
-        panel_width, panel_height = 400, 280
-        arcade.draw_rectangle_filled(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, panel_width, panel_height, PANEL_COLOR)
-        arcade.draw_rectangle_outline(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, panel_width, panel_height, ACCENT_COLOR, 3)
+        # Compact game over screen: overlay and main panel (static, pre-batched)
+        self.game_over_shapes.draw()
         
         # Results
         player_score = self.game.players[0]["score"]
@@ -950,25 +1465,23 @@ class QGame(arcade.Window):
             sub_text = "An evenly matched game!"
         
         # Title
-        arcade.draw_text("GAME OVER", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90, 
-                       ACCENT_COLOR, 32, bold=True, anchor_x="center", font_name="Arial")
-        arcade.draw_text(winner_text, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50,
-                       winner_color, 28, bold=True, anchor_x="center", font_name="Arial")
-        arcade.draw_text(sub_text, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20,
-                       (255, 255, 255), 16, bold=True, anchor_x="center", font_name="Arial")
+        self.txt_game_over.draw()
+        if self.txt_winner.text != winner_text:
+            self.txt_winner.text = winner_text
+            self.txt_winner.color = winner_color
+        self.txt_winner.draw()
+        self.txt_winner_sub.text = sub_text
+        self.txt_winner_sub.draw()
         
         # Scores
-        y = SCREEN_HEIGHT // 2 - 20
-        arcade.draw_text(f"Player: {player_score}", SCREEN_WIDTH // 2 - 80, y, 
-                        (255, 255, 255), 20, anchor_x="center", anchor_y="center", bold=True, font_name="Arial")
-        arcade.draw_text(f"AI: {ai_score}", SCREEN_WIDTH // 2 + 80, y, 
-                        (255, 255, 255), 20, anchor_x="center", anchor_y="center", bold=True, font_name="Arial")
+        self.txt_final_player.text = f"Player: {player_score}"
+        self.txt_final_player.draw()
+        self.txt_final_ai.text = f"AI: {ai_score}"
+        self.txt_final_ai.draw()
         
         # Restart instruction
-        blink = int(self.animation_time * 2) % 2 == 0
-        if blink:
-            arcade.draw_text("Click anywhere to play again", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60,
-                           (255, 255, 255), 14, anchor_x="center", font_name="Arial")
+        if self.blink:
+            self.txt_play_again.draw()
 
     def show_message(self, text):
         self.message = text
@@ -987,31 +1500,21 @@ class QGame(arcade.Window):
         
         # In-game hover detection
         if self.game.game_state == GameState.PLAYER_TURN:
+            # Only the nearest cell can contain the cursor, so snap to it directly
             grid_half = 4
-            for row in range(-grid_half, grid_half + 1):
-                for col in range(-grid_half, grid_half + 1):
-                    tile_x = BOARD_OFFSET_X + col * TILE_SIZE
-                    tile_y = BOARD_OFFSET_Y + row * TILE_SIZE
-                    
-                    if (abs(x - tile_x) < TILE_SIZE // 2 and 
-                        abs(y - tile_y) < TILE_SIZE // 2):
-                        self.hover_pos = (row, col)
-                        return
+            col = round((x - BOARD_OFFSET_X) / TILE_SIZE)
+            row = round((y - BOARD_OFFSET_Y) / TILE_SIZE)
+            if (-grid_half <= row <= grid_half and -grid_half <= col <= grid_half and
+                abs(x - (BOARD_OFFSET_X + col * TILE_SIZE)) < TILE_SIZE // 2 and
+                abs(y - (BOARD_OFFSET_Y + row * TILE_SIZE)) < TILE_SIZE // 2):
+                self.hover_pos = (row, col)
+                return
             self.hover_pos = None
         
         # Button hover detection - UPDATED FOR LEFT SIDE
         self.hover_button = None
         if self.game.game_state == GameState.PLAYER_TURN:
-            button_x = 100
-            start_y = 400
-            
-            buttons = [
-                ("PLACE", button_x, start_y),
-                ("CLEAR", button_x, start_y - 60),
-                ("PASS", button_x, start_y - 120)
-            ]
-            
-            for text, btn_x, btn_y in buttons:
+            for text, btn_x, btn_y in BUTTON_LAYOUT:
                 if (btn_x - 50 <= x <= btn_x + 50 and 
                     btn_y - 20 <= y <= btn_y + 20):
                     self.hover_button = text
@@ -1029,12 +1532,14 @@ class QGame(arcade.Window):
             return
         
         if self.game.game_state == GameState.GAME_OVER:
-            self.__init__()  # Restart game
+            self.reset_game()  # Restart game
             self.show_welcome = False
             return
         
-        if self.game.game_state == GameState.AI_TURN and not self.ai_thinking:
-            self.ai_thinking = True
+        if self.game.game_state == GameState.AI_TURN:
+            if not self.ai_thinking:
+                self.ai_thinking = True
+                self.ai_move_at = self.animation_time + 0.5  # Small delay for visual effect
             return
         
         # Player's turn interactions
@@ -1046,9 +1551,8 @@ class QGame(arcade.Window):
         
         if self.selected_tile and self.hover_pos:
             row, col = self.hover_pos
-            valid_positions = self.game.get_valid_positions()
             
-            if (row, col) in valid_positions:
+            if (row, col) in self.game.valid_positions:
                 self.placement_positions.append((row, col, self.selected_tile))
                 self.selected_tile = None
                 self.show_message(f"Tile placed at ({row}, {col})")
@@ -1057,21 +1561,24 @@ class QGame(arcade.Window):
         if not (30 <= y <= 170):  # Hand area
             return False
         
-        player = self.game.players[0]
-        start_x = SCREEN_WIDTH // 2 - (len(player["hand"]) * (TILE_SIZE + 8)) // 2
+        hand = self.game.players[0]["hand"]
+        start_x = SCREEN_WIDTH // 2 - (len(hand) * (TILE_SIZE + 8)) // 2
+        tile_y = 80  # Hand panel center
         
-        for i, tile in enumerate(player["hand"]):
-            tile_x = start_x + i * (TILE_SIZE + 8)
-            tile_y = 80  # Hand panel center
-            
-            if abs(x - tile_x) < TILE_SIZE // 2 and abs(y - tile_y) < TILE_SIZE // 2:
-                if tile == self.selected_tile:
-                    self.selected_tile = None
-                    self.show_message("Tile deselected")
-                else:
-                    self.selected_tile = tile
-                    self.show_message(f"Selected tile {i + 1}")
-                return True
+        # Tiles don't overlap, so only the nearest one can contain the click
+        i = round((x - start_x) / (TILE_SIZE + 8))
+        if not 0 <= i < len(hand):
+            return False
+        tile_x = start_x + i * (TILE_SIZE + 8)
+        if abs(x - tile_x) < TILE_SIZE // 2 and abs(y - tile_y) < TILE_SIZE // 2:
+            tile = hand[i]
+            if tile == self.selected_tile:
+                self.selected_tile = None
+                self.show_message("Tile deselected")
+            else:
+                self.selected_tile = tile
+                self.show_message(f"Selected tile {i + 1}")
+            return True
         return False
 
     def check_button_click(self, x, y) -> bool:
@@ -1079,18 +1586,11 @@ class QGame(arcade.Window):
         if self.game.game_state != GameState.PLAYER_TURN:
             return False
             
-        button_x = 100
-        start_y = 400
-        
-        buttons = [
-            (SCREEN_WIDTH // 2 - 120, button_x, start_y, self.place_tiles, len(self.placement_positions) > 0),
-            (SCREEN_WIDTH // 2, button_x, start_y - 60, self.clear_selection, len(self.placement_positions) > 0),
-            (SCREEN_WIDTH // 2 + 120, button_x, start_y - 120, self.pass_turn, True)
-        ]
-        
-        for _, btn_x, btn_y, callback, enabled in buttons:
-            if enabled and (btn_x - 50 <= x <= btn_x + 50 and btn_y - 20 <= y <= btn_y + 20):
-                callback()
+        has_placements = len(self.placement_positions) > 0
+        for text, btn_x, btn_y in BUTTON_LAYOUT:
+            if ((text == "PASS" or has_placements) and
+                    btn_x - 50 <= x <= btn_x + 50 and btn_y - 20 <= y <= btn_y + 20):
+                self.button_actions[text]()
                 return True
         return False
 
@@ -1149,23 +1649,27 @@ class QGame(arcade.Window):
         self.animation_time += delta_time
         
         # Animate background particles
-        for particle in self.particles:
-            particle['x'] += particle['speed']
-            if particle['x'] > SCREEN_WIDTH + 10:
-                particle['x'] = -10
-                particle['y'] = random.randint(0, SCREEN_HEIGHT)
+        for circle, speed in zip(self.particles, self.particle_speeds):
+            circle.x += speed
+            if circle.x > SCREEN_WIDTH + 10:
+                circle.x = -10
+                circle.y = random.randint(0, SCREEN_HEIGHT)
         
         if self.message_timer > 0:
             self.message_timer -= delta_time
         
         if self.game.game_state == GameState.AI_TURN and self.ai_thinking:
-            time.sleep(0.5)  # Small delay for visual effect
-            success, score, msg = self.game.ai_make_move()
-            if success:
-                self.show_message(f"AI placed tiles! Score: +{score}")
-            else:
-                self.show_message("AI passed turn")
-            self.ai_thinking = False
+            if self.ai_future is None:
+                self.ai_future = self.ai_executor.submit(self.game.snapshot().find_ai_move)
+            elif self.ai_future.done() and self.animation_time >= self.ai_move_at:
+                move = self.ai_future.result()
+                self.ai_future = None
+                success, score, msg = self.game.play_ai_move(move)
+                if success:
+                    self.show_message(f"AI placed tiles! Score: +{score}")
+                else:
+                    self.show_message("AI passed turn")
+                self.ai_thinking = False
 
 def main():
     game = QGame()